@@ -22,15 +22,16 @@ SEED_ADDRS="${4:?Missing seed_addresses (comma-separated)}"
 
 ENGAGEMENT_ROOT="${ENGAGEMENTS_DIR:-analysis/engagements}/$PROTOCOL_SLUG"
 
-echo "=== Claude Protocol Auditor v3.0 — Engagement Dispatch ==="
-echo "Architecture: Parallel Intelligence → Convergence → Cook"
-echo ""
-echo "Protocol:     $PROTOCOL_SLUG"
-echo "Chain ID:     $CHAIN_ID"
-echo "Fork Block:   $FORK_BLOCK"
-echo "Seed Addrs:   $SEED_ADDRS"
-echo "Engagement:   $ENGAGEMENT_ROOT"
-echo ""
+printf '%s\n' \
+    "=== Claude Protocol Auditor v3.0 — Engagement Dispatch ===" \
+    "Architecture: Parallel Intelligence → Convergence → Cook" \
+    "" \
+    "Protocol:     $PROTOCOL_SLUG" \
+    "Chain ID:     $CHAIN_ID" \
+    "Fork Block:   $FORK_BLOCK" \
+    "Seed Addrs:   $SEED_ADDRS" \
+    "Engagement:   $ENGAGEMENT_ROOT" \
+    ""
 
 # Create engagement workspace
 mkdir -p "$ENGAGEMENT_ROOT"/{contract-bundles,tenderly/{rpc,api},notes,proofs,agent-outputs}
@@ -96,10 +97,9 @@ EOF
 
 # Create empty note stubs
 for note in value-model entrypoints; do
-    if [ ! -f "$ENGAGEMENT_ROOT/notes/$note.md" ]; then
-        echo "# $note" > "$ENGAGEMENT_ROOT/notes/$note.md"
-        echo "" >> "$ENGAGEMENT_ROOT/notes/$note.md"
-        echo "## Status: EMPTY — Pending agent analysis" >> "$ENGAGEMENT_ROOT/notes/$note.md"
+    note_path="$ENGAGEMENT_ROOT/notes/$note.md"
+    if [ ! -f "$note_path" ]; then
+        printf '# %s\n\n## Status: EMPTY — Pending agent analysis\n' "$note" > "$note_path"
     fi
 done
 
@@ -136,43 +136,44 @@ cat > "$ENGAGEMENT_ROOT/orchestrator-state.md" << EOF
 Run Phase 1: reality-anchor → universe-cartographer
 EOF
 
-echo "=== Workspace Created ==="
-echo ""
-echo "=== v3.0 Agent Dispatch Plan ==="
-echo ""
-echo "PHASE 1: Pin Reality (Sequential)"
-echo "  1. reality-anchor          → Validate RPC, fork block, chain ID"
-echo "  2. universe-cartographer   → Map all contracts, resolve proxies, acquire source"
-echo ""
-echo "PHASE 2: Parallel Intelligence (ALL 8 agents SIMULTANEOUSLY)"
-echo "  ┌─ protocol-logic-dissector   → Intent vs implementation gaps, implicit invariants"
-echo "  ├─ economic-model-analyst     → Value equations, custody/entitlements, measurement gaps"
-echo "  ├─ state-machine-explorer     → Implicit states, transitions, desynchronization"
-echo "  ├─ cross-function-weaver      → State dependencies, stale data, composition bugs"
-echo "  ├─ temporal-sequence-analyst   → Ordering dependencies, timing, epoch boundaries"
-echo "  ├─ numeric-precision-analyst   → Exchange rates, rounding, arithmetic edges"
-echo "  ├─ oracle-external-analyst     → External trust, manipulation economics"
-echo "  └─ control-flow-mapper         → Authority graph, governance timing, keeper deps"
-echo ""
-echo "PHASE 3: Convergence (Single agent reads ALL Phase 2 outputs)"
-echo "  → convergence-synthesizer    → Build convergence matrix, find multi-lens convergence"
-echo "  → COMMIT to top convergence point (CP-1)"
-echo ""
-echo "PHASE 3.5: Quick Validation"
-echo "  → Orchestrator runs 1 cast call / simulation to validate CP-1 thesis"
-echo ""
-echo "PHASE 4: Deep Drill (1-3 on-demand specialists for committed CP)"
-echo "  Available: flash-economics-lab, callback-reentry-analyst, upgrade-proxy-analyst,"
-echo "            storage-layout-hunter, governance-attack-lab, bridge-crosschain-analyst,"
-echo "            evm-underbelly-lab, token-semantics-analyst, numeric-boundary-explorer"
-echo ""
-echo "PHASE 5: Cook (Single agent builds ONE exploit step-by-step)"
-echo "  → scenario-cooker            → Verify pre-conditions → test each step → write PoC"
-echo ""
-echo "PHASE 6: Proof & Review (Sequential)"
-echo "  1. proof-constructor         → Build E3-grade evidence"
-echo "  2. adversarial-reviewer      → Challenge every assumption"
-echo "  3. report-synthesizer        → Final report (if finding confirmed)"
-echo ""
-echo "=== Ready for Claude Code Task tool agent dispatch ==="
-echo "=== Load agent prompts from: $AUDITOR_ROOT/agents/ ==="
+printf '%s\n' \
+    "=== Workspace Created ===" \
+    "" \
+    "=== v3.0 Agent Dispatch Plan ===" \
+    "" \
+    "PHASE 1: Pin Reality (Sequential)" \
+    "  1. reality-anchor          → Validate RPC, fork block, chain ID" \
+    "  2. universe-cartographer   → Map all contracts, resolve proxies, acquire source" \
+    "" \
+    "PHASE 2: Parallel Intelligence (ALL 8 agents SIMULTANEOUSLY)" \
+    "  ┌─ protocol-logic-dissector   → Intent vs implementation gaps, implicit invariants" \
+    "  ├─ economic-model-analyst     → Value equations, custody/entitlements, measurement gaps" \
+    "  ├─ state-machine-explorer     → Implicit states, transitions, desynchronization" \
+    "  ├─ cross-function-weaver      → State dependencies, stale data, composition bugs" \
+    "  ├─ temporal-sequence-analyst   → Ordering dependencies, timing, epoch boundaries" \
+    "  ├─ numeric-precision-analyst   → Exchange rates, rounding, arithmetic edges" \
+    "  ├─ oracle-external-analyst     → External trust, manipulation economics" \
+    "  └─ control-flow-mapper         → Authority graph, governance timing, keeper deps" \
+    "" \
+    "PHASE 3: Convergence (Single agent reads ALL Phase 2 outputs)" \
+    "  → convergence-synthesizer    → Build convergence matrix, find multi-lens convergence" \
+    "  → COMMIT to top convergence point (CP-1)" \
+    "" \
+    "PHASE 3.5: Quick Validation" \
+    "  → Orchestrator runs 1 cast call / simulation to validate CP-1 thesis" \
+    "" \
+    "PHASE 4: Deep Drill (1-3 on-demand specialists for committed CP)" \
+    "  Available: flash-economics-lab, callback-reentry-analyst, upgrade-proxy-analyst," \
+    "            storage-layout-hunter, governance-attack-lab, bridge-crosschain-analyst," \
+    "            evm-underbelly-lab, token-semantics-analyst, numeric-boundary-explorer" \
+    "" \
+    "PHASE 5: Cook (Single agent builds ONE exploit step-by-step)" \
+    "  → scenario-cooker            → Verify pre-conditions → test each step → write PoC" \
+    "" \
+    "PHASE 6: Proof & Review (Sequential)" \
+    "  1. proof-constructor         → Build E3-grade evidence" \
+    "  2. adversarial-reviewer      → Challenge every assumption" \
+    "  3. report-synthesizer        → Final report (if finding confirmed)" \
+    "" \
+    "=== Ready for Claude Code Task tool agent dispatch ===" \
+    "=== Load agent prompts from: $AUDITOR_ROOT/agents/ ==="